@@ -31,60 +31,226 @@ Delta encoding format (--delta mode):
 """
 
 import argparse
+import hashlib
+import http.client
+import json
+import os
 import re
 import sys
+import urllib.error
+import urllib.parse
 import urllib.request
 from pathlib import Path
-from typing import List, Tuple
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
 
 
-def download_animation_data(url: str) -> str:
-    """Download animation.c from GitHub repository."""
+# Nyancat color character to palette index (default: background)
+COLOR_MAP = {
+    ',': 0,   # Dark blue background
+    '.': 1,   # White (stars)
+    "'": 2,   # Black (border)
+    '@': 3,   # Tan/Light pink (poptart) -> Light pink/beige
+    '$': 5,   # Pink poptart -> Hot pink
+    '-': 6,   # Red poptart
+    '>': 6,   # Red rainbow (same as red poptart)
+    '&': 7,   # Orange rainbow
+    '+': 8,   # Yellow rainbow
+    '#': 9,   # Green rainbow
+    '=': 10,  # Light blue rainbow
+    ';': 11,  # Dark blue/Purple rainbow -> Purple
+    '*': 12,  # Gray cat face
+    '%': 4,   # Pink cheeks
+}
+
+# 256-entry bytes.translate table indexed by character code, built once at load time
+_lut = bytearray(256)
+for _char, _index in COLOR_MAP.items():
+    _lut[ord(_char)] = _index
+_PALETTE_LUT = bytes(_lut)
+del _lut, _char, _index
+
+# Read size for streaming animation.c
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Frame array in animation.c: group 1 = frame number, group 2 = initializer body
+_FRAME_RE = re.compile(rb'const\s+char\s+\*\s*frame(\d+)\[\]\s*=\s*\{([^}]+)\}', re.DOTALL)
+
+# Preformatted C hex literal for every byte value
+_HEX_BYTE = tuple(f"0x{byte:02x}" for byte in range(256))
+
+# Maximal run of one repeated byte (palette index)
+_RUN_RE = re.compile(rb'(.)\1*', re.DOTALL)
+
+# Collapse any nonzero byte to 1 (changed-pixel mask)
+_CHANGED_LUT = bytes([0] + [1] * 255)
+
+
+def default_cache_dir() -> Path:
+    """Return the on-disk cache directory for downloaded animation.c copies."""
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'nyancat-gen'
+
+
+def _read_chunks(stream: BinaryIO) -> Iterator[bytes]:
+    """Yield a binary stream in fixed-size chunks until EOF."""
+    while True:
+        chunk = stream.read(_DOWNLOAD_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _cache_path(cache_dir: Path, url: str, suffix: str) -> Path:
+    """Return the cache file for url with the given suffix."""
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]
+    return cache_dir / f"{key}{suffix}"
+
+
+def download_animation_data(url: str, cache_dir: Optional[Path] = None,
+                            use_cached: bool = True) -> Iterator[bytes]:
+    """
+    Stream animation.c from GitHub repository in fixed-size chunks.
+
+    With cache_dir set, the last copy of an http(s) URL is kept on disk and
+    revalidated with If-None-Match / If-Modified-Since. A 304 reply, or a
+    network error or 5xx server reply while a copy exists, is served from
+    the cache instead. A fresh download is only staged next to the cache;
+    commit_cached_animation() promotes it once its frames have parsed.
+    With use_cached=False the cached copy is ignored but still refreshed.
+    """
+    data_path = meta_path = None
+    headers = {}
+    if cache_dir is not None and urllib.parse.urlsplit(url).scheme in ('http', 'https'):
+        data_path = _cache_path(cache_dir, url, '.c')
+        meta_path = _cache_path(cache_dir, url, '.json')
+        # Drop anything staged by an earlier run that never validated
+        for staged in (_cache_path(cache_dir, url, '.c.part'),
+                       _cache_path(cache_dir, url, '.json.part')):
+            try:
+                staged.unlink()
+            except OSError:
+                pass
+        if use_cached and data_path.exists() and meta_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                meta = {}
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+    cached = use_cached and data_path is not None and data_path.exists()
+
+    streamed = False
     try:
-        with urllib.request.urlopen(url) as response:
-            return response.read().decode('utf-8')
+        request = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(request) as response:
+            body = bytearray()
+            for chunk in _read_chunks(response):
+                streamed = True
+                body += chunk
+                yield chunk
+            # read(amt) returns short data at EOF instead of raising, so a
+            # connection closed before Content-Length must be caught here
+            if getattr(response, 'length', None):
+                raise http.client.IncompleteRead(bytes(body), response.length)
+            validators = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }
+    except urllib.error.HTTPError as e:
+        if not cached or (e.code != 304 and e.code < 500):
+            print(f"Error downloading from {url}: {e}", file=sys.stderr)
+            sys.exit(1)
+        if e.code == 304:
+            print(f"Not modified, using cached copy: {data_path}")
+        else:
+            print(f"Warning: download failed ({e}), using cached copy: {data_path}", file=sys.stderr)
     except Exception as e:
-        print(f"Error downloading from {url}: {e}", file=sys.stderr)
-        sys.exit(1)
+        if streamed or not cached:
+            print(f"Error downloading from {url}: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Warning: download failed ({e}), using cached copy: {data_path}", file=sys.stderr)
+    else:
+        # Cache is best-effort; a read-only home must not break the build
+        if data_path is not None:
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                _cache_path(cache_dir, url, '.c.part').write_bytes(body)
+                _cache_path(cache_dir, url, '.json.part').write_text(json.dumps(validators))
+            except OSError as e:
+                print(f"Warning: could not update cache {data_path}: {e}", file=sys.stderr)
+        return
+
+    with open(data_path, 'rb') as f:
+        yield from _read_chunks(f)
+
+
+def commit_cached_animation(url: str, cache_dir: Path) -> None:
+    """Promote a staged download into the cache once its frames have parsed."""
+    staged_data = _cache_path(cache_dir, url, '.c.part')
+    staged_meta = _cache_path(cache_dir, url, '.json.part')
+    if not staged_data.exists() or not staged_meta.exists():
+        return
+    try:
+        # Data first: new validators must never point at old data
+        staged_data.replace(_cache_path(cache_dir, url, '.c'))
+        staged_meta.replace(_cache_path(cache_dir, url, '.json'))
+    except OSError as e:
+        print(f"Warning: could not update cache {cache_dir}: {e}", file=sys.stderr)
 
 
-def parse_animation_c(content: str) -> List[List[str]]:
+def parse_animation_c(chunks: Iterable[bytes]) -> List[bytes]:
     """
     Parse animation.c to extract frame data.
 
-    Returns list of 12 frames, each frame is list of pixel strings.
+    Frame arrays are matched as soon as their closing brace has arrived, so
+    parsing overlaps with a streaming download.
+
+    Returns list of 12 frames, each frame is 4096 bytes of pixel characters.
     """
+    # Find all frame arrays (frame0[] through frame11[]) incrementally
+    frame_texts = {}
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        scan_end = 0
+        for match in _FRAME_RE.finditer(buffer):
+            frame_texts.setdefault(int(match.group(1)), match.group(2))
+            scan_end = match.end()
+        # Keep only the unmatched tail, which may hold a partial frame
+        del buffer[:scan_end]
+
     frames = []
 
-    # Find all frame arrays (frame0[] through frame11[])
     for frame_num in range(12):
-        pattern = rf'const\s+char\s+\*\s*frame{frame_num}\[\]\s*=\s*\{{([^}}]+)\}}'
-        match = re.search(pattern, content, re.DOTALL)
+        frame_text = frame_texts.get(frame_num)
 
-        if not match:
+        if frame_text is None:
             print(f"Error: Could not find frame{frame_num}[] in animation.c", file=sys.stderr)
             sys.exit(1)
 
-        frame_text = match.group(1)
-
-        # Extract all quoted strings for this frame
-        frame_lines = re.findall(r'"([^"]*)"', frame_text)
+        # Extract all quoted strings for this frame (no escaped quotes in the art)
+        frame_lines = frame_text.split(b'"')[1::2]
 
         # Concatenate all lines into single frame (64 lines × 64 chars = 4096 pixels)
-        frame_data = ''.join(frame_lines)
+        frame_data = b''.join(frame_lines)
 
         if len(frame_data) != 4096:
             print(f"Error: frame{frame_num} has {len(frame_data)} pixels, expected 4096", file=sys.stderr)
             sys.exit(1)
 
-        frames.append(list(frame_data))
+        frames.append(frame_data)
 
     return frames
 
 
-def map_color_to_palette(char: str) -> int:
+def map_frame_to_palette(pixels: bytes) -> bytes:
     """
-    Map nyancat color character to palette index.
+    Map a frame of nyancat color characters to palette indices.
+
+    The whole frame goes through one bytes.translate call using COLOR_MAP;
+    unknown characters map to the background (0).
 
     Original mapping from klange/nyancat upstream:
     , = dark blue background
@@ -102,51 +268,50 @@ def map_color_to_palette(char: str) -> int:
     * = gray (cat face)
     % = pink (cheeks)
     """
-    color_map = {
-        ',': 0,   # Dark blue background
-        '.': 1,   # White (stars)
-        "'": 2,   # Black (border)
-        '@': 3,   # Tan/Light pink (poptart) -> Light pink/beige
-        '$': 5,   # Pink poptart -> Hot pink
-        '-': 6,   # Red poptart
-        '>': 6,   # Red rainbow (same as red poptart)
-        '&': 7,   # Orange rainbow
-        '+': 8,   # Yellow rainbow
-        '#': 9,   # Green rainbow
-        '=': 10,  # Light blue rainbow
-        ';': 11,  # Dark blue/Purple rainbow -> Purple
-        '*': 12,  # Gray cat face
-        '%': 4,   # Pink cheeks
-    }
-    return color_map.get(char, 0)  # Default to background
-
-
-def compress_frame_opcode_rle(pixels: List[str]) -> List[int]:
+    return pixels.translate(_PALETTE_LUT)
+
+
+def find_runs(colors: bytes) -> Iterator[Tuple[int, int, int]]:
+    """
+    Split palette indices into runs of a single color.
+
+    Yields (start, end, color) for each run; the scan itself happens in the
+    regex engine, so Python only iterates once per run rather than per pixel.
+    """
+    for run in _RUN_RE.finditer(colors):
+        yield run.start(), run.end(), colors[run.start()]
+
+
+def changed_mask(a: bytes, b: bytes) -> bytes:
+    """
+    Compare two equal-length palette buffers position by position.
+
+    Returns a mask with 1 where the pixels differ and 0 where they match.
+    The XOR of the two buffers as big integers is zero exactly at the
+    unchanged positions.
+    """
+    diff = int.from_bytes(a, 'big') ^ int.from_bytes(b, 'big')
+    return diff.to_bytes(len(a), 'big').translate(_CHANGED_LUT)
+
+
+def compress_frame_opcode_rle(pixels: bytes) -> bytearray:
     """
     Compress frame using opcode-based RLE (baseline compression).
 
-    Returns list of opcodes (integers 0-255).
+    Returns opcode bytes (0-255).
     """
     if len(pixels) != 4096:
         print(f"Error: Frame must have 4096 pixels, got {len(pixels)}", file=sys.stderr)
         sys.exit(1)
 
-    opcodes = []
-    i = 0
-    current_color = -1
+    colors = map_frame_to_palette(pixels)
 
-    while i < len(pixels):
-        color = map_color_to_palette(pixels[i])
+    opcodes = bytearray()
 
-        # Set color if different from current
-        if color != current_color:
-            opcodes.append(0x00 | color)  # SetColor opcode
-            current_color = color
-
-        # Count consecutive pixels of same color
-        count = 1
-        while i + count < len(pixels) and map_color_to_palette(pixels[i + count]) == color:
-            count += 1
+    # Adjacent runs always differ in color, so each run starts with SetColor
+    for start, end, color in find_runs(colors):
+        opcodes.append(0x00 | color)  # SetColor opcode
+        count = end - start
 
         # Encode run length with appropriate opcodes (may need multiple for long runs)
         remaining = count
@@ -167,41 +332,36 @@ def compress_frame_opcode_rle(pixels: List[str]) -> List[int]:
                 opcodes.append(0x30 | 0x0F)  # 16 chunks = 256 pixels
                 remaining -= 256
 
-        i += count
-
     # End of frame marker
     opcodes.append(0xFF)
 
     return opcodes
 
 
-def compress_delta_frame(prev_pixels: List[str], curr_pixels: List[str]) -> List[int]:
+def compress_delta_frame(prev_pixels: bytes, curr_pixels: bytes) -> bytearray:
     """
     Compress delta frame using skip + repeat encoding.
 
-    Returns list of opcodes exploiting temporal coherence.
+    Returns opcode bytes exploiting temporal coherence.
     """
     if len(prev_pixels) != 4096 or len(curr_pixels) != 4096:
         print("Error: Frames must have 4096 pixels", file=sys.stderr)
         sys.exit(1)
 
     # Convert to color indices
-    prev_colors = [map_color_to_palette(p) for p in prev_pixels]
-    curr_colors = [map_color_to_palette(p) for p in curr_pixels]
+    prev_colors = map_frame_to_palette(prev_pixels)
+    curr_colors = map_frame_to_palette(curr_pixels)
 
-    opcodes = []
-    i = 0
-    current_color = -1
+    changed = changed_mask(prev_colors, curr_colors)
 
-    while i < 4096:
-        # Count consecutive unchanged pixels
-        skip_count = 0
-        while i + skip_count < 4096 and prev_colors[i + skip_count] == curr_colors[i + skip_count]:
-            skip_count += 1
+    opcodes = bytearray()
+    current_color = -1
 
-        # Encode skip if any unchanged pixels
-        if skip_count > 0:
-            remaining_skip = skip_count
+    # Alternate between unchanged (skip) and changed segments
+    for start, end, is_changed in find_runs(changed):
+        if not is_changed:
+            # Encode skip of unchanged pixels
+            remaining_skip = end - start
             while remaining_skip > 0:
                 if remaining_skip <= 16:
                     # 0x1Y: Skip 1-16 unchanged pixels
@@ -223,52 +383,40 @@ def compress_delta_frame(prev_pixels: List[str], curr_pixels: List[str]) -> List
                     # Max skip: 1024 pixels
                     opcodes.append(0x50 | 0x0F)
                     remaining_skip -= 1024
-
-            i += skip_count
-            if i >= 4096:
-                break
-
-        # Handle changed pixels
-        color = curr_colors[i]
-        if color != current_color:
-            opcodes.append(0x00 | color)  # SetColor
-            current_color = color
-
-        # Count consecutive changed pixels of same color
-        run_len = 1
-        while i + run_len < 4096 and \
-              curr_colors[i + run_len] == color and \
-              prev_colors[i + run_len] != curr_colors[i + run_len]:
-            run_len += 1
-
-        # Encode changed run
-        remaining_run = run_len
-        while remaining_run > 0:
-            if remaining_run <= 16:
-                # 0x2Y: Repeat 1-16 changed pixels
-                opcodes.append(0x20 | (remaining_run - 1))
-                remaining_run = 0
-            elif remaining_run <= 256:
-                # 0x4Y: Repeat 16-256 changed pixels (chunks of 16)
-                chunks = min(remaining_run // 16, 16)
-                if chunks > 0:
-                    opcodes.append(0x40 | (chunks - 1))
-                    remaining_run -= chunks * 16
-            else:
-                # Max run: 256 pixels
-                opcodes.append(0x40 | 0x0F)
-                remaining_run -= 256
-
-        i += run_len
+            continue
+
+        # Split changed segment into runs of the same color
+        for run_start, run_end, color in find_runs(curr_colors[start:end]):
+            if color != current_color:
+                opcodes.append(0x00 | color)  # SetColor
+                current_color = color
+
+            # Encode changed run
+            remaining_run = run_end - run_start
+            while remaining_run > 0:
+                if remaining_run <= 16:
+                    # 0x2Y: Repeat 1-16 changed pixels
+                    opcodes.append(0x20 | (remaining_run - 1))
+                    remaining_run = 0
+                elif remaining_run <= 256:
+                    # 0x4Y: Repeat 16-256 changed pixels (chunks of 16)
+                    chunks = min(remaining_run // 16, 16)
+                    if chunks > 0:
+                        opcodes.append(0x40 | (chunks - 1))
+                        remaining_run -= chunks * 16
+                else:
+                    # Max run: 256 pixels
+                    opcodes.append(0x40 | 0x0F)
+                    remaining_run -= 256
 
     opcodes.append(0xFF)
     return opcodes
 
 
-def generate_header(frames: List[List[str]], output_path: Path, use_delta: bool = False) -> None:
+def generate_header(frames: List[bytes], output_path: Path, use_delta: bool = False) -> None:
     """Generate nyancat-data.h with compressed frame data."""
 
-    # Compress all frames
+    # Compress all frames (one opcode byte per element)
     compressed_frames = []
 
     if use_delta:
@@ -277,9 +425,9 @@ def generate_header(frames: List[List[str]], output_path: Path, use_delta: bool
         compressed_frames.append(baseline_opcodes)
         print(f"Frame  0 (baseline): {len(frames[0])} pixels → {len(baseline_opcodes)} opcodes ({100 - len(baseline_opcodes) * 100 // len(frames[0])}% reduction)")
 
-        # Frames 1-11: delta encoding
-        for i in range(1, 12):
-            delta_opcodes = compress_delta_frame(frames[i-1], frames[i])
+        # Frames 1-11: delta encoding; each (prev, curr) pair is independent
+        delta_frames = map(compress_delta_frame, frames[:-1], frames[1:])
+        for i, delta_opcodes in enumerate(delta_frames, start=1):
             compressed_frames.append(delta_opcodes)
             print(f"Frame {i:2d} (delta):    {len(frames[i])} pixels → {len(delta_opcodes)} opcodes ({100 - len(delta_opcodes) * 100 // len(frames[i])}% reduction)")
     else:
@@ -294,10 +442,8 @@ def generate_header(frames: List[List[str]], output_path: Path, use_delta: bool
     for frame_data in compressed_frames[:-1]:
         offsets.append(offsets[-1] + len(frame_data))
 
-    # Flatten all compressed data
-    all_data = []
-    for frame_data in compressed_frames:
-        all_data.extend(frame_data)
+    # Flatten all compressed data (single C-level concatenation)
+    all_data = b''.join(compressed_frames)
 
     total_original = 12 * 4096
     total_compressed = len(all_data)
@@ -307,8 +453,7 @@ def generate_header(frames: List[List[str]], output_path: Path, use_delta: bool
 
     # Generate header file
     compression_type = "delta-RLE" if use_delta else "opcode-RLE"
-    with open(output_path, 'w') as f:
-        f.write(f"""// SPDX-License-Identifier: MIT
+    parts = [f"""// SPDX-License-Identifier: MIT
 // Auto-generated nyancat animation data with {compression_type} compression
 // DO NOT EDIT - Generated by scripts/gen-nyancat-data.py
 
@@ -322,50 +467,59 @@ def generate_header(frames: List[List[str]], output_path: Path, use_delta: bool
 
 // Frame offset table (12 frames)
 static const uint16_t nyancat_frame_offsets[12] = {{
-""")
-
-        # Write frame offsets
-        for i in range(0, len(offsets), 6):
-            chunk = offsets[i:i+6]
-            f.write("    " + ", ".join(f"{offset:5d}" for offset in chunk))
-            if i + 6 < len(offsets):
-                f.write(",")
-            f.write("\n")
-
-        f.write("};\n\n")
-        f.write(f"// Compressed animation data ({len(all_data)} bytes)\n")
-
-        if use_delta:
-            f.write(f"// Delta encoding format:\n")
-            f.write(f"//   Frame 0 (baseline): 0x0X=SetColor, 0x2Y=Repeat(1-16), 0x3Y=Repeat*16(16-256)\n")
-            f.write(f"//   Frame 1-11 (delta):  0x0X=SetColor, 0x1Y=Skip(1-16), 0x2Y=Repeat(1-16),\n")
-            f.write(f"//                        0x3Y=Skip*16(16-256), 0x4Y=Repeat*16(16-256),\n")
-            f.write(f"//                        0x5Y=Skip*64(64-1024), 0xFF=EndOfFrame\n")
-        else:
-            f.write(f"// Opcode format:\n")
-            f.write(f"//   0x0X = SetColor (X = color 0-13)\n")
-            f.write(f"//   0x2Y = Repeat (Y+1) times (1-16 pixels)\n")
-            f.write(f"//   0x3Y = Repeat (Y+1)×16 times (16-256 pixels)\n")
-            f.write(f"//   0xFF = EndOfFrame\n")
+"""]
+
+    # Frame offsets (6 per line)
+    offset_lines = [
+        "    " + ", ".join(f"{offset:5d}" for offset in offsets[i:i+6])
+        for i in range(0, len(offsets), 6)
+    ]
+    parts.append(",\n".join(offset_lines) + "\n")
+
+    parts.append("};\n\n")
+    parts.append(f"// Compressed animation data ({len(all_data)} bytes)\n")
+
+    if use_delta:
+        parts.append("// Delta encoding format:\n")
+        parts.append("//   Frame 0 (baseline): 0x0X=SetColor, 0x2Y=Repeat(1-16), 0x3Y=Repeat*16(16-256)\n")
+        parts.append("//   Frame 1-11 (delta):  0x0X=SetColor, 0x1Y=Skip(1-16), 0x2Y=Repeat(1-16),\n")
+        parts.append("//                        0x3Y=Skip*16(16-256), 0x4Y=Repeat*16(16-256),\n")
+        parts.append("//                        0x5Y=Skip*64(64-1024), 0xFF=EndOfFrame\n")
+    else:
+        parts.append("// Opcode format:\n")
+        parts.append("//   0x0X = SetColor (X = color 0-13)\n")
+        parts.append("//   0x2Y = Repeat (Y+1) times (1-16 pixels)\n")
+        parts.append("//   0x3Y = Repeat (Y+1)×16 times (16-256 pixels)\n")
+        parts.append("//   0xFF = EndOfFrame\n")
 
-        f.write(f"static const uint8_t nyancat_compressed_data[{len(all_data)}] = {{\n")
+    parts.append(f"static const uint8_t nyancat_compressed_data[{len(all_data)}] = {{\n")
 
-        # Write compressed data (16 bytes per line)
-        for i in range(0, len(all_data), 16):
-            chunk = all_data[i:i+16]
-            f.write("    " + ", ".join(f"0x{byte:02x}" for byte in chunk))
-            if i + 16 < len(all_data):
-                f.write(",")
-            f.write("\n")
+    # Compressed data (16 bytes per line)
+    data_lines = [
+        "    " + ", ".join([_HEX_BYTE[byte] for byte in all_data[i:i+16]])
+        for i in range(0, len(all_data), 16)
+    ]
+    parts.append(",\n".join(data_lines) + "\n")
 
-        f.write("};\n\n")
-        f.write("#endif // NYANCAT_DATA_H\n")
+    parts.append("};\n\n")
+    parts.append("#endif // NYANCAT_DATA_H\n")
+
+    # Write the whole header with a single call
+    with open(output_path, 'w') as f:
+        f.write("".join(parts))
 
     print(f"\nGenerated: {output_path}")
     print(f"Header size: {output_path.stat().st_size} bytes")
 
 
-def decompress_and_verify(frames: List[List[str]], use_delta: bool = False) -> bool:
+def count_mismatches(expected: bytes, actual: bytes) -> int:
+    """Count differing pixels between two 4096-pixel palette buffers."""
+    if expected == actual:
+        return 0
+    return changed_mask(expected, actual).count(1)
+
+
+def decompress_and_verify(frames: List[bytes], use_delta: bool = False) -> bool:
     """
     Decompress compressed frames and verify against originals.
 
@@ -376,27 +530,29 @@ def decompress_and_verify(frames: List[List[str]], use_delta: bool = False) -> b
     all_match = True
 
     if use_delta:
-        # Verify delta compression
+        # Verify delta compression, chaining each decoded frame into the next
+        # delta exactly as the on-target decoder does
         prev_frame = None
+        prev_decoded = None
         for frame_idx, original_frame in enumerate(frames):
             if frame_idx == 0:
                 # Baseline frame
                 opcodes = compress_frame_opcode_rle(original_frame)
                 decompressed = decompress_baseline(opcodes)
-                prev_frame = original_frame
             else:
                 # Delta frame
                 opcodes = compress_delta_frame(prev_frame, original_frame)
-                decompressed = decompress_delta(decompress_baseline(compress_frame_opcode_rle(prev_frame)), opcodes)
-                prev_frame = original_frame
+                decompressed = decompress_delta(prev_decoded, opcodes)
+            prev_frame = original_frame
+            prev_decoded = decompressed
 
             # Verify
-            original_colors = [map_color_to_palette(p) for p in original_frame]
+            original_colors = map_frame_to_palette(original_frame)
             if len(decompressed) != 4096:
                 print(f"Frame {frame_idx}: Length mismatch! Expected 4096, got {len(decompressed)}")
                 all_match = False
             else:
-                mismatches = sum(1 for a, b in zip(original_colors, decompressed) if a != b)
+                mismatches = count_mismatches(original_colors, decompressed)
                 if mismatches > 0:
                     print(f"Frame {frame_idx}: {mismatches} pixel mismatches")
                     all_match = False
@@ -413,8 +569,8 @@ def decompress_and_verify(frames: List[List[str]], use_delta: bool = False) -> b
                 all_match = False
                 continue
 
-            original_colors = [map_color_to_palette(p) for p in original_frame]
-            mismatches = sum(1 for a, b in zip(original_colors, decompressed) if a != b)
+            original_colors = map_frame_to_palette(original_frame)
+            mismatches = count_mismatches(original_colors, decompressed)
 
             if mismatches > 0:
                 print(f"Frame {frame_idx}: {mismatches} pixel mismatches")
@@ -425,9 +581,9 @@ def decompress_and_verify(frames: List[List[str]], use_delta: bool = False) -> b
     return all_match
 
 
-def decompress_baseline(opcodes: List[int]) -> List[int]:
+def decompress_baseline(opcodes: bytes) -> bytearray:
     """Decompress baseline RLE opcodes to color indices."""
-    decompressed = []
+    decompressed = bytearray()
     current_color = 0
     i = 0
 
@@ -441,17 +597,17 @@ def decompress_baseline(opcodes: List[int]) -> List[int]:
             current_color = opcode & 0x0F
         elif (opcode & 0xF0) == 0x20:
             count = (opcode & 0x0F) + 1
-            decompressed.extend([current_color] * count)
+            decompressed += bytes((current_color,)) * count
         elif (opcode & 0xF0) == 0x30:
             count = ((opcode & 0x0F) + 1) * 16
-            decompressed.extend([current_color] * count)
+            decompressed += bytes((current_color,)) * count
 
     return decompressed
 
 
-def decompress_delta(prev_frame: List[int], opcodes: List[int]) -> List[int]:
+def decompress_delta(prev_frame: bytes, opcodes: bytes) -> bytearray:
     """Decompress delta frame opcodes using previous frame."""
-    decompressed = list(prev_frame)  # Start with previous frame
+    decompressed = bytearray(prev_frame)  # Start with previous frame
     pos = 0
     current_color = 0
     i = 0
@@ -468,18 +624,16 @@ def decompress_delta(prev_frame: List[int], opcodes: List[int]) -> List[int]:
             pos += (opcode & 0x0F) + 1  # Skip unchanged
         elif (opcode & 0xF0) == 0x20:
             count = (opcode & 0x0F) + 1  # Repeat changed
-            for _ in range(count):
-                if pos < 4096:
-                    decompressed[pos] = current_color
-                    pos += 1
+            end = min(pos + count, 4096)
+            decompressed[pos:end] = bytes((current_color,)) * (end - pos)
+            pos = end
         elif (opcode & 0xF0) == 0x30:
             pos += ((opcode & 0x0F) + 1) * 16  # Skip unchanged (long)
         elif (opcode & 0xF0) == 0x40:
             count = ((opcode & 0x0F) + 1) * 16  # Repeat changed (long)
-            for _ in range(count):
-                if pos < 4096:
-                    decompressed[pos] = current_color
-                    pos += 1
+            end = min(pos + count, 4096)
+            decompressed[pos:end] = bytes((current_color,)) * (end - pos)
+            pos = end
         elif (opcode & 0xF0) == 0x50:
             pos += ((opcode & 0x0F) + 1) * 64  # Skip unchanged (very long)
 
@@ -511,16 +665,25 @@ def main():
         action='store_true',
         help='Verify compression/decompression without generating output'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always download animation.c, ignoring (but refreshing) any cached copy'
+    )
 
     args = parser.parse_args()
 
     # Download animation data
     print(f"Downloading from: {args.url}")
-    content = download_animation_data(args.url)
+    cache_dir = default_cache_dir()
+    chunks = download_animation_data(args.url, cache_dir, use_cached=not args.no_cache)
 
-    # Parse frames
+    # Parse frames while the download streams in
     print("Parsing animation frames...")
-    frames = parse_animation_c(content)
+    frames = parse_animation_c(chunks)
+
+    # Only a download whose frames all parsed is kept for later runs
+    commit_cached_animation(args.url, cache_dir)
     print(f"Parsed {len(frames)} frames, {len(frames[0])} pixels each")
 
     # Verify mode